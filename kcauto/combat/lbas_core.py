@@ -117,7 +117,8 @@ class LBASCore(object):
             if (
                 kca_u.kca.exists('upper_right', 'combat|lbas_group_tab_1.png')
                 or kca_u.kca.exists(
-                    'upper_right', 'combat|lbas_group_tab_1_only.png'))
+                    'upper_right', 'combat|lbas_group_tab_1_only.png',
+                    cached=True))
             else False)
 
     def _open_lbas_panel(self):
@@ -5,9 +5,9 @@ from kca_enums.fleet_modes import CombinedFleetModeEnum
 
 class ConfigExpedition(ConfigBase):
     _enabled = False
-    _fleet_2 = []
-    _fleet_3 = []
-    _fleet_4 = []
+    _fleet_2 = ()
+    _fleet_3 = ()
+    _fleet_4 = ()
 
     def __init__(self, config):
         super().__init__(config)
@@ -49,7 +49,8 @@ class ConfigExpedition(ConfigBase):
                     self._config['combat.fleet_mode'])):
             raise ValueError(
                 "Fleet 2 cannot be assigned to expeditions when combat is CF")
-        self._fleet_2 = [ExpeditionEnum(expedition) for expedition in value]
+        self._fleet_2 = tuple(
+            ExpeditionEnum(expedition) for expedition in value)
 
     @property
     def fleet_3(self):
@@ -60,7 +61,8 @@ class ConfigExpedition(ConfigBase):
         if not self._validate_expeditions(value):
             raise ValueError(
                 "Specified value for EXPEDITIONS_FLEET3 is not a valid exped")
-        self._fleet_3 = [ExpeditionEnum(expedition) for expedition in value]
+        self._fleet_3 = tuple(
+            ExpeditionEnum(expedition) for expedition in value)
 
     @property
     def fleet_4(self):
@@ -71,7 +73,8 @@ class ConfigExpedition(ConfigBase):
         if not self._validate_expeditions(value):
             raise ValueError(
                 "Specified value for EXPEDITIONS_FLEET4 is not a valid exped")
-        self._fleet_4 = [ExpeditionEnum(expedition) for expedition in value]
+        self._fleet_4 = tuple(
+            ExpeditionEnum(expedition) for expedition in value)
 
     def expeditions_for_fleet(self, value):
         if not 1 < value < 5:
@@ -1,4 +1,5 @@
-from pyvisauto import Region
+from datetime import datetime
+from pyvisauto import Region, FindFailed
 from random import choice
 
 import api.api_core as api
@@ -16,9 +17,9 @@ from util.logger import Log
 
 class ExpeditionCore(CoreBase):
     NUM_VISIBLE_EXPEDITONS = 8
-    SUPPORT_EXPEDITIONS = [
+    SUPPORT_EXPEDITIONS = frozenset((
         ExpeditionEnum.E5_33, ExpeditionEnum.E5_34, ExpeditionEnum.EE_S1,
-        ExpeditionEnum.EE_S2]
+        ExpeditionEnum.EE_S2))
     _available_expeditions = []
     module_name = 'expedition'
     module_display_name = 'Expedition'
@@ -65,8 +66,9 @@ class ExpeditionCore(CoreBase):
 
     def expect_returned_fleets(self):
         returned_fleets = []
+        now = datetime.now()
         for fleet in flt.fleets.expedition_fleets:
-            if fleet.has_returned:
+            if fleet.has_returned_by(now):
                 returned_fleets.append(fleet.fleet_id)
 
         if len(returned_fleets) == 1:
@@ -80,25 +82,22 @@ class ExpeditionCore(CoreBase):
 
     @property
     def fleets_are_ready(self):
-        if len(self.fleets_to_send) == 1:
+        fleets_to_send = self.fleets_to_send
+        if len(fleets_to_send) == 1:
             Log.log_msg(
-                f"Fleet {self.fleets_to_send[0].fleet_id} ready for "
-                "expedition.")
+                f"Fleet {fleets_to_send[0].fleet_id} ready for expedition.")
             return True
-        elif len(self.fleets_to_send) > 1:
+        elif len(fleets_to_send) > 1:
             display_text = kca_u.kca.readable_list_join(
-                [fleet.fleet_id for fleet in self.fleets_to_send])
+                [fleet.fleet_id for fleet in fleets_to_send])
             Log.log_msg(f"Fleets {display_text} ready for expedition.")
             return True
         return False
 
     @property
     def fleets_at_base(self):
-        fleets_at_base = []
-        for fleet in flt.fleets.expedition_fleets:
-            if fleet.at_base:
-                fleets_at_base.append(fleet)
-        return fleets_at_base
+        return [
+            fleet for fleet in flt.fleets.expedition_fleets if fleet.at_base]
 
     @property
     def fleets_to_send(self):
@@ -106,7 +105,7 @@ class ExpeditionCore(CoreBase):
         for fleet in self.fleets_at_base:
             fleet_expeditions = cfg.config.expedition.expeditions_for_fleet(
                 fleet.fleet_id)
-            if set(self.SUPPORT_EXPEDITIONS) & set(fleet_expeditions):
+            if not self.SUPPORT_EXPEDITIONS.isdisjoint(fleet_expeditions):
                 if com.combat.should_and_able_to_sortie:
                     fleets_to_send.append(fleet)
             else:
@@ -154,12 +153,10 @@ class ExpeditionCore(CoreBase):
         index = expedition_list.index(expedition)
         offset = 0
         if index >= self.NUM_VISIBLE_EXPEDITONS:
-            if kca_u.kca.exists('lower_left', 'global|scroll_next.png'):
-                self._scroll_list_down()
+            self._scroll_list_down()
             offset = len(expedition_list) - self.NUM_VISIBLE_EXPEDITONS
         else:
-            if kca_u.kca.exists('upper_left', 'global|scroll_prev.png'):
-                self._scroll_list_up()
+            self._scroll_list_up()
 
         true_index = index - offset
         if not 0 <= true_index < self.NUM_VISIBLE_EXPEDITONS:
@@ -202,14 +199,31 @@ class ExpeditionCore(CoreBase):
     def _scroll_list_up(self):
         """Method to scroll the expedition list all the way up.
         """
-        while kca_u.kca.click_existing('upper_left', 'global|scroll_prev.png'):
-            pass
+        self._scroll_list('upper_left', 'global|scroll_prev.png')
 
     def _scroll_list_down(self):
         """Method to scroll the expedition list all the way down.
         """
-        while kca_u.kca.click_existing('lower_left', 'global|scroll_next.png'):
-            pass
+        self._scroll_list('lower_left', 'global|scroll_next.png')
+
+    def _scroll_list(self, region, asset):
+        """Method that clicks a scroll button until it is no longer shown.
+        The button is searched for in the full region only once; subsequent
+        checks are limited to the area where the button was found.
+
+        Args:
+            region (str): pre-defined region key to search for the button in.
+            asset (str): kcauto-style asset path of the scroll button.
+        """
+        try:
+            button = kca_u.kca.find(region, asset)
+        except FindFailed:
+            return
+        while True:
+            kca_u.kca.click(button)
+            kca_u.kca.sleep()
+            if not kca_u.kca.exists(button, asset):
+                break
 
 
 expedition = ExpeditionCore()
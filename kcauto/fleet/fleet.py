@@ -11,17 +11,19 @@ from util.logger import Log
 
 
 class Fleet(object):
-    fleet_id = None
-    _fleet_type = None
-    _enabled = False
-    _at_base = True
-    _ship_ids = []
-    _return_time = None
-    ship_data = []
-    visual_health = []
+    __slots__ = (
+        'fleet_id', '_fleet_type', '_enabled', '_at_base', '_ship_ids',
+        '_return_time', 'ship_data', 'visual_health')
 
     def __init__(self, fleet_id, fleet_type, enabled=True):
         self.fleet_id = fleet_id
+        self._fleet_type = None
+        self._enabled = False
+        self._at_base = True
+        self._ship_ids = []
+        self._return_time = None
+        self.ship_data = []
+        self.visual_health = []
         self.enabled = enabled
         self.fleet_type = fleet_type
 
@@ -66,7 +68,7 @@ class Fleet(object):
         elif value is False and print_log:
             Log.log_success(f"Fleet {self.fleet_id} deactivated.")
             self._at_base = True
-            self._ships = []
+            self._ship_ids = []
             self._return_time = None
             self.ship_data = []
         self._enabled = value
@@ -119,10 +121,7 @@ class Fleet(object):
 
     @property
     def needs_resupply(self):
-        for ship in self.ship_data:
-            if ship.needs_resupply:
-                return True
-        return False
+        return any(ship.needs_resupply for ship in self.ship_data)
 
     @needs_resupply.setter
     def needs_resupply(self, value):
@@ -136,17 +135,12 @@ class Fleet(object):
 
     @property
     def needs_repair(self):
-        for ship in self.ship_data:
-            if ship.damage >= cfg.config.combat.repair_limit:
-                return True
-        return False
+        repair_limit = cfg.config.combat.repair_limit
+        return any(ship.damage >= repair_limit for ship in self.ship_data)
 
     @property
     def under_repair(self):
-        for ship in self.ship_data:
-            if ship.under_repair:
-                return True
-        return False
+        return any(ship.under_repair for ship in self.ship_data)
 
     @property
     def weakest_state(self):
@@ -172,11 +166,10 @@ class Fleet(object):
                 lowest_morale = ship.morale
         return lowest_morale
 
-    @property
-    def has_returned(self):
+    def has_returned_by(self, now):
         if self.return_time is None:
             return False
-        return datetime.now() > self.return_time
+        return now > self.return_time
 
     @property
     def combat_fleet_status(self):
@@ -61,8 +61,8 @@ class FleetCore(object):
     @property
     def ships_in_fleets(self):
         ships = []
-        for fleet_id in self.fleets:
-            ships.extend(self.fleets[fleet_id].ship_ids)
+        for fleet in self.fleets.values():
+            ships.extend(fleet.ship_ids)
         return ships
 
     @property
@@ -95,14 +95,13 @@ class FleetCore(object):
     @property
     def active_ships(self):
         active_ships = []
-        for fleet_id in self.fleets:
-            if self.fleets[fleet_id].enabled:
-                active_ships += self.fleets[fleet_id].ship_data
+        for fleet in self.fleets.values():
+            if fleet.enabled:
+                active_ships += fleet.ship_data
         return active_ships
 
     def __str__(self):
-        for fleet_id in self.fleets:
-            fleet = self.fleets[fleet_id]
+        for fleet in self.fleets.values():
             if fleet.enabled:
                 Log.log_msg(fleet)
 
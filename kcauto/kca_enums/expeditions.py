@@ -1,3 +1,4 @@
+from collections import namedtuple
 from datetime import timedelta
 from kca_enums.enum_base import EnumBase
 
@@ -18,27 +19,27 @@ class ExpeditionEnum(EnumBase):
 
     @property
     def world(self):
-        return self.name.split('_')[0][1]
+        return EXPEDITION_INFO[self.value].world
 
     @property
     def expedition(self):
-        return self.name.split('_')[1]
+        return EXPEDITION_INFO[self.value].expedition
 
     @property
     def duration(self):
-        return DURATIONS[self.value]
+        return EXPEDITION_INFO[self.value].duration
 
     @property
     def display_name(self):
-        if self.value == 33:
-            return '33 - Node Support'
-        elif self.value == 34:
-            return '34 - Boss Support'
-        elif self.value == 301:
-            return 'S1 - Event Node Support'
-        elif self.value == 302:
-            return 'S2 - Event Boss Node Support'
-        return self.name.split('_')[1]
+        return DISPLAY_NAMES.get(self.value, self.expedition)
+
+
+DISPLAY_NAMES = {
+    33: '33 - Node Support',
+    34: '34 - Boss Support',
+    301: 'S1 - Event Node Support',
+    302: 'S2 - Event Boss Node Support'
+}
 
 
 DURATIONS = {
@@ -91,7 +92,16 @@ DURATIONS = {
     41: timedelta(hours=0, minutes=59, seconds=30),
     42: timedelta(hours=7, minutes=59, seconds=30),
     43: timedelta(hours=11, minutes=59, seconds=30),
-    444: timedelta(hours=9, minutes=59, seconds=30),
+    44: timedelta(hours=9, minutes=59, seconds=30),
     301: timedelta(minutes=15),
     302: timedelta(minutes=30)
 }
+
+ExpeditionInfo = namedtuple(
+    'ExpeditionInfo', ['world', 'expedition', 'duration'])
+
+EXPEDITION_INFO = {
+    e.value: ExpeditionInfo(
+        e.name.split('_')[0][1], e.name.split('_')[1], DURATIONS[e.value])
+    for e in ExpeditionEnum
+}
@@ -22,6 +22,7 @@ class Kca(object):
     """Primary kcauto utility class.
     """
     ASSETS_FOLDER = 'assets'
+    _asset_path_cache = {}
     visual_hook = None
     api_hook = None
     game_x = None
@@ -293,6 +294,8 @@ class Kca(object):
 
     def _create_asset_path(self, asset):
         """Helper method for generating the proper OS-safe path to an asset.
+        Generated paths are cached per asset string, as the same assets are
+        looked up repeatedly throughout a session.
 
         Args:
             asset (str): kcauto-internal asset-style path. This should be in
@@ -302,8 +305,11 @@ class Kca(object):
         Returns:
             str: OS-safe path to an asset.
         """
-        asset_split = asset.split('|')
-        return os.path.join(self.ASSETS_FOLDER, *asset_split)
+        if asset not in self._asset_path_cache:
+            asset_split = asset.split('|')
+            self._asset_path_cache[asset] = os.path.join(
+                self.ASSETS_FOLDER, *asset_split)
+        return self._asset_path_cache[asset]
 
     def _get_region(self, region):
         """Helper method that returns a Region based on the region passed in.
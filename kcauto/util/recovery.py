@@ -36,7 +36,8 @@ class Recovery(object):
 
         if (
                 kca_u.kca.exists(screen, 'global|next.png')
-                or kca_u.kca.exists(screen, 'global|next_alt.png')):
+                or kca_u.kca.exists(
+                    screen, 'global|next_alt.png', cached=True)):
             Log.log_warn("Results screen detected.")
             if cls.recovery_from_results(screen):
                 Log.log_success("Results Recovery successful.")
@@ -106,7 +107,8 @@ class Recovery(object):
         """
         while (
                 kca_u.kca.exists(screen, 'global|next.png')
-                or kca_u.kca.exists(screen, 'global|next_alt.png')):
+                or kca_u.kca.exists(
+                    screen, 'global|next_alt.png', cached=True)):
             if kca_u.kca.exists(screen, 'global|next.png', cached=True):
                 region = kca_u.kca.find(screen, 'global|next.png', cached=True)
             elif kca_u.kca.exists(screen, 'global|next_alt.png', cached=True):